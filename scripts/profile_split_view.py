@@ -6,11 +6,18 @@ Measures and reports:
 1. Launch time (target: < 3 seconds)
 2. Input latency (target: < 50ms)
 3. Output rendering latency (target: < 100ms)
-4. select() timeout optimization
-5. Memory usage
-6. CPU usage (idle and active states)
+4. PTY workloads: keystroke echo latency, bulk throughput and two-pane
+   interleaved throughput, each with CPU time and peak RSS
+5. select() timeout optimization
+6. Memory usage
+
+Results can be saved as a JSON baseline and compared against a previous
+baseline; the script exits non-zero when a metric regresses beyond the
+allowed tolerance. The PTY workloads and baseline handling live in
+split_view_bench.py, which also runs on its own.
 """
 
+import argparse
 import os
 import sys
 import time
@@ -27,6 +34,15 @@ from lib.yoyo_tui_v3.split_view.pane import Pane, PaneBounds
 from lib.yoyo_tui_v3.split_view.layout import LayoutManager
 from lib.yoyo_tui_v3.split_view.terminal_control import TerminalController
 
+from split_view_bench import (
+    find_regressions,
+    load_baseline,
+    print_comparison,
+    run_terminal_workloads,
+    save_baseline,
+    terminal_metrics,
+)
+
 
 class PerformanceProfiler:
     """Comprehensive performance profiler for split view."""
@@ -104,13 +120,23 @@ class PerformanceProfiler:
         times = []
         test_data = b'A' * 100  # 100 bytes
 
-        # Measure 100 renders
-        for _ in range(100):
-            start = time.perf_counter()
-            term.move_cursor(bounds.y, bounds.x)
-            # Simulate write (don't actually write to avoid messing up terminal)
-            elapsed = time.perf_counter() - start
-            times.append(elapsed * 1000)  # Convert to ms
+        # Write into a scratch PTY instead of the real terminal
+        master_fd, slave_fd = os.openpty()
+        os.set_blocking(master_fd, False)
+
+        try:
+            # Measure 100 renders
+            for _ in range(100):
+                start = time.perf_counter()
+                term.move_cursor(bounds.y, bounds.x)
+                os.write(slave_fd, test_data)
+                elapsed = time.perf_counter() - start
+                times.append(elapsed * 1000)  # Convert to ms
+
+                self._drain(master_fd)
+        finally:
+            os.close(slave_fd)
+            os.close(master_fd)
 
         self.results['output_rendering'] = {
             'avg': statistics.mean(times),
@@ -122,6 +148,12 @@ class PerformanceProfiler:
             'description': 'Output rendering latency'
         }
 
+    def profile_terminal_workloads(self):
+        """Measure echo latency and throughput through real PTYs."""
+        print("Profiling PTY workloads...")
+
+        self.results.update(run_terminal_workloads())
+
     def profile_layout_calculations(self):
         """Measure layout calculation performance."""
         print("Profiling layout calculations...")
@@ -187,26 +219,6 @@ class PerformanceProfiler:
             pane1.terminate()
             pane2.terminate()
 
-    def profile_cpu_usage_theoretical(self):
-        """Calculate theoretical CPU usage based on select() timeout."""
-        print("Profiling CPU usage (theoretical)...")
-
-        # Current implementation uses 0.1s (100ms) timeout in select()
-        select_timeout_ms = 100
-        processing_time_ms = 1  # Estimated processing time per iteration
-
-        # Calculate theoretical CPU usage
-        cycle_time_ms = select_timeout_ms + processing_time_ms
-        cpu_percent = (processing_time_ms / cycle_time_ms) * 100
-
-        self.results['cpu_usage_idle'] = {
-            'theoretical': cpu_percent,
-            'select_timeout': select_timeout_ms,
-            'unit': '%',
-            'target': 5,  # Should be < 5%
-            'description': 'Theoretical idle CPU usage'
-        }
-
     def profile_select_timeout_optimization(self):
         """Analyze select() timeout optimization."""
         print("Analyzing select() timeout...")
@@ -257,6 +269,57 @@ class PerformanceProfiler:
             'description': 'Rapid resize operations throughput'
         }
 
+    @staticmethod
+    def _drain(fd):
+        """Read everything currently buffered on a non-blocking fd."""
+        while True:
+            try:
+                if not os.read(fd, 65536):
+                    return
+            except BlockingIOError:
+                return
+
+    def collect_metrics(self):
+        """Flatten results into {metric: {'value': ..., 'higher_is_better': ...}}."""
+        metrics = {}
+
+        for key in ['launch_init_time', 'input_latency', 'output_rendering', 'layout_calculation']:
+            if key in self.results:
+                metrics[f'{key}.avg'] = {'value': self.results[key]['avg'], 'higher_is_better': False}
+                if 'p95' in self.results[key]:
+                    metrics[f'{key}.p95'] = {'value': self.results[key]['p95'], 'higher_is_better': False}
+
+        if 'memory_usage' in self.results:
+            metrics['memory_usage.increase'] = {
+                'value': self.results['memory_usage']['increase'], 'higher_is_better': False
+            }
+        metrics.update(terminal_metrics(self.results))
+        if 'rapid_operations' in self.results:
+            metrics['rapid_operations.ops_per_sec'] = {
+                'value': self.results['rapid_operations']['ops_per_sec'], 'higher_is_better': True
+            }
+
+        return metrics
+
+    def save_baseline(self, path):
+        """Save current metrics as a JSON baseline."""
+        save_baseline(path, self.collect_metrics())
+        print(f"\nBaseline saved to {path}")
+
+    def compare_baseline(self, path, tolerance):
+        """
+        Compare current metrics against a JSON baseline.
+
+        Returns:
+            List of (metric, baseline_value, current_value) tuples that
+            regressed beyond `tolerance` (see find_regressions).
+        """
+        baseline = load_baseline(path)
+        current = self.collect_metrics()
+        regressions = find_regressions(baseline, current, tolerance)
+        print_comparison(baseline, current, regressions, tolerance)
+        return regressions
+
     def generate_report(self):
         """Generate comprehensive performance report."""
         print("\n" + "="*80)
@@ -264,9 +327,9 @@ class PerformanceProfiler:
         print("="*80)
 
         # Group results
-        latency_metrics = ['launch_init_time', 'input_latency', 'output_rendering', 'layout_calculation']
-        resource_metrics = ['memory_usage', 'cpu_usage_idle']
-        optimization_metrics = ['select_timeout', 'rapid_operations']
+        latency_metrics = ['launch_init_time', 'input_latency', 'echo_latency', 'output_rendering', 'layout_calculation']
+        resource_metrics = ['memory_usage', 'echo_latency', 'output_throughput', 'interleaved_throughput']
+        optimization_metrics = ['select_timeout', 'rapid_operations', 'output_throughput', 'interleaved_throughput']
 
         # Print latency metrics
         print("\n[LATENCY METRICS]")
@@ -300,11 +363,9 @@ class PerformanceProfiler:
                     print(f"  Increase:    {result['increase']:>10.2f} {result['unit']} {status}")
                     print(f"  Target:      < {result['target']} {result['unit']}")
 
-                elif key == 'cpu_usage_idle':
-                    status = "✓ PASS" if result['theoretical'] < result['target'] else "✗ FAIL"
-                    print(f"  Theoretical: {result['theoretical']:>10.2f} {result['unit']} {status}")
-                    print(f"  select():    {result['select_timeout']:>10.0f} ms")
-                    print(f"  Target:      < {result['target']} {result['unit']}")
+                elif 'cpu_time' in result:
+                    print(f"  CPU time:    {result['cpu_time']:>10.3f} s")
+                    print(f"  Peak RSS:    {result['max_rss_mb']:>10.2f} MB")
 
         # Print optimization metrics
         print("\n[OPTIMIZATION ANALYSIS]")
@@ -326,6 +387,13 @@ class PerformanceProfiler:
                     print(f"  Throughput:  {result['ops_per_sec']:>10.1f} {result['unit']} {status}")
                     print(f"  Target:      > {result['target']} {result['unit']}")
 
+                elif key in ('output_throughput', 'interleaved_throughput'):
+                    status = "✓ PASS" if result['mb_per_sec'] > result['target'] else "✗ FAIL"
+                    print(f"  Bytes:       {result['bytes']:>10d}")
+                    print(f"  Total time:  {result['total_time']:>10.3f} s")
+                    print(f"  Throughput:  {result['mb_per_sec']:>10.1f} {result['unit']} {status}")
+                    print(f"  Target:      > {result['target']} {result['unit']}")
+
         # Overall summary
         print("\n[OVERALL ASSESSMENT]")
         print("-"*80)
@@ -342,14 +410,14 @@ class PerformanceProfiler:
                 total += 1
                 if result['increase'] < result['target']:
                     passes += 1
-            elif 'target' in result and 'theoretical' in result:
-                total += 1
-                if result['theoretical'] < result['target']:
-                    passes += 1
             elif 'target' in result and 'ops_per_sec' in result:
                 total += 1
                 if result['ops_per_sec'] > result['target']:
                     passes += 1
+            elif 'target' in result and 'mb_per_sec' in result:
+                total += 1
+                if result['mb_per_sec'] > result['target']:
+                    passes += 1
 
         if total > 0:
             pass_rate = (passes / total) * 100
@@ -373,9 +441,9 @@ class PerformanceProfiler:
         self.profile_launch_time()
         self.profile_input_latency()
         self.profile_output_rendering()
+        self.profile_terminal_workloads()
         self.profile_layout_calculations()
         self.profile_memory_usage()
-        self.profile_cpu_usage_theoretical()
         self.profile_select_timeout_optimization()
         self.profile_rapid_operations()
 
@@ -384,9 +452,28 @@ class PerformanceProfiler:
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Split view performance profiler")
+    parser.add_argument('--save-baseline', metavar='PATH',
+                        help='Save results as a JSON baseline')
+    parser.add_argument('--baseline', metavar='PATH',
+                        help='Compare results against a JSON baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed regression as a fraction (default: 0.2)')
+    args = parser.parse_args()
+
     profiler = PerformanceProfiler()
     profiler.run_all_profiles()
 
+    if args.save_baseline:
+        profiler.save_baseline(args.save_baseline)
+
+    if args.baseline:
+        regressions = profiler.compare_baseline(args.baseline, args.tolerance)
+        if regressions:
+            print(f"Status: ✗ {len(regressions)} metric(s) regressed")
+            sys.exit(1)
+        print("Status: ✓ NO REGRESSIONS")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Split View Benchmark Helpers
+
+Standalone terminal-layer workloads and JSON baseline handling shared with
+profile_split_view.py. Nothing here imports the split view package, so the
+PTY workloads (keystroke echo latency, bulk throughput and two-pane
+interleaved throughput, each with CPU time and peak RSS) can run and be
+regression-checked on their own:
+
+    python3 scripts/split_view_bench.py --save-baseline bench.json
+    python3 scripts/split_view_bench.py --baseline bench.json
+"""
+
+import argparse
+import json
+import os
+import resource
+import select
+import statistics
+import sys
+import termios
+import time
+import tty
+from pathlib import Path
+
+
+# Absolute slack per metric, so baselines at or near zero (or negative, like
+# a memory increase) don't flag measurement noise as a regression.
+METRIC_FLOORS = {
+    'launch_init_time.avg': 1.0,                # ms
+    'input_latency.avg': 0.5,                   # ms
+    'input_latency.p95': 0.5,                   # ms
+    'output_rendering.avg': 0.5,                # ms
+    'output_rendering.p95': 0.5,                # ms
+    'echo_latency.avg': 0.05,                   # ms
+    'echo_latency.p95': 0.1,                    # ms
+    'layout_calculation.avg': 5.0,              # μs
+    'memory_usage.increase': 5.0,               # MB
+    'max_rss_mb': 5.0,                          # MB
+    'output_throughput.mb_per_sec': 1.0,        # MB/s
+    'output_throughput.cpu_time': 0.05,         # s
+    'interleaved_throughput.mb_per_sec': 1.0,   # MB/s
+    'interleaved_throughput.cpu_time': 0.05,    # s
+    'echo_latency.cpu_time': 0.05,              # s
+    'rapid_operations.ops_per_sec': 100,        # ops/s
+}
+
+DEFAULT_FLOOR = 1e-3
+
+
+def _max_rss_mb(usage):
+    """Peak RSS from a getrusage() result (kilobytes on Linux, bytes on macOS)."""
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return usage.ru_maxrss / scale
+
+
+def with_resource_usage(workload, *args, **kwargs):
+    """
+    Run a workload and add the CPU time and peak RSS it took to its result.
+
+    Every workload here reads and writes its PTYs in this process, so
+    RUSAGE_SELF covers both ends of the terminal.
+    """
+    before = resource.getrusage(resource.RUSAGE_SELF)
+    result = workload(*args, **kwargs)
+    after = resource.getrusage(resource.RUSAGE_SELF)
+
+    result['cpu_time'] = (
+        (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+    )
+    result['max_rss_mb'] = _max_rss_mb(after)
+    return result
+
+
+def _remaining(deadline, what):
+    """Seconds left until `deadline`, raising once it has passed."""
+    remaining = deadline - time.perf_counter()
+    if remaining <= 0:
+        raise RuntimeError(f"Timed out waiting for {what}")
+    return remaining
+
+
+def _pump(streams, total_bytes, timeout):
+    """
+    Push `total_bytes` through each of `streams` raw PTYs from one select loop.
+
+    Slaves are non-blocking and every wait is bounded by the deadline, so a
+    stalled reader raises instead of blocking the writer forever.
+
+    Returns:
+        (bytes received across all PTYs, elapsed seconds)
+    """
+    chunk = b'x' * 79 + b'\n'
+    chunk = chunk * (65536 // len(chunk))
+
+    pairs = [os.openpty() for _ in range(streams)]
+    written = {}
+    received = {}
+    for master_fd, slave_fd in pairs:
+        tty.setraw(slave_fd)  # No newline translation, bytes pass through 1:1
+        os.set_blocking(slave_fd, False)
+        written[slave_fd] = 0
+        received[master_fd] = 0
+
+    try:
+        start = time.perf_counter()
+        deadline = start + timeout
+
+        while any(count < total_bytes for count in received.values()):
+            total = sum(received.values())
+            remaining = _remaining(
+                deadline, f"PTY output ({total} of {total_bytes * streams} bytes received)"
+            )
+            readers = [fd for fd, count in received.items() if count < total_bytes]
+            writers = [fd for fd, count in written.items() if count < total_bytes]
+            readable, writable, _ = select.select(readers, writers, [], remaining)
+
+            # Alternate writes across the PTYs, like panes sharing one loop
+            for fd in writable:
+                try:
+                    written[fd] += os.write(fd, chunk[:total_bytes - written[fd]])
+                except BlockingIOError:
+                    pass
+
+            for fd in readable:
+                try:
+                    data = os.read(fd, 65536)
+                except OSError:
+                    data = b''
+                if not data:
+                    raise RuntimeError(
+                        f"PTY reader received {received[fd]} of {total_bytes} bytes"
+                    )
+                received[fd] += len(data)
+
+        elapsed = time.perf_counter() - start
+    finally:
+        for master_fd, slave_fd in pairs:
+            os.close(slave_fd)
+            os.close(master_fd)
+
+    return sum(received.values()), elapsed
+
+
+def measure_pty_throughput(total_bytes=16 * 1024 * 1024, timeout=30):
+    """
+    Push `total_bytes` through a raw PTY and measure throughput.
+
+    Returns:
+        Result dict with bytes, total_time and mb_per_sec.
+
+    Raises:
+        RuntimeError: If every byte was not received within `timeout` seconds.
+    """
+    received, elapsed = _pump(1, total_bytes, timeout)
+
+    return {
+        'bytes': received,
+        'total_time': elapsed,
+        'mb_per_sec': received / elapsed / 1024 / 1024,
+        'unit': 'MB/s',
+        'target': 10,  # Should sustain > 10 MB/s
+        'description': f'Bulk output throughput ({total_bytes // (1024 * 1024)} MB through a PTY)'
+    }
+
+
+def measure_interleaved_throughput(total_bytes=8 * 1024 * 1024, timeout=30):
+    """
+    Push `total_bytes` through each of two raw PTYs with interleaved writes.
+
+    Returns:
+        Result dict with bytes (both PTYs), total_time and mb_per_sec.
+
+    Raises:
+        RuntimeError: If every byte was not received within `timeout` seconds.
+    """
+    received, elapsed = _pump(2, total_bytes, timeout)
+
+    return {
+        'bytes': received,
+        'total_time': elapsed,
+        'mb_per_sec': received / elapsed / 1024 / 1024,
+        'unit': 'MB/s',
+        'target': 10,  # Should sustain > 10 MB/s across both panes
+        'description': f'Two-pane interleaved throughput ({total_bytes // (1024 * 1024)} MB per PTY)'
+    }
+
+
+def _read_until(fd, done, deadline):
+    """Read from `fd` until done(data) is true, bounded by `deadline`."""
+    data = b''
+    while not done(data):
+        remaining = _remaining(deadline, "PTY echo")
+        readable, _, _ = select.select([fd], [], [], remaining)
+        if readable:
+            chunk = os.read(fd, 1024)
+            if not chunk:
+                raise RuntimeError("PTY closed while waiting for echo")
+            data += chunk
+    return data
+
+
+def measure_echo_latency(samples=500, timeout=10):
+    """
+    Time the kernel echo of single keystrokes on a cooked-mode PTY.
+
+    Each sample writes one byte to the master and waits for its echo. Every
+    256 keystrokes a newline is sent and the line is read on the slave, so
+    the canonical line buffer never fills.
+
+    Returns:
+        Result dict with avg/min/max/p95 latency in ms.
+
+    Raises:
+        RuntimeError: If an echo does not arrive within `timeout` seconds.
+    """
+    master_fd, slave_fd = os.openpty()
+    attrs = termios.tcgetattr(slave_fd)
+    attrs[3] |= termios.ECHO | termios.ICANON  # lflag: cooked mode with echo
+    termios.tcsetattr(slave_fd, termios.TCSANOW, attrs)
+    times = []
+
+    try:
+        deadline = time.perf_counter() + timeout
+
+        for i in range(samples):
+            start = time.perf_counter()
+            os.write(master_fd, b'x')
+            _read_until(master_fd, lambda data: len(data) >= 1, deadline)
+            times.append((time.perf_counter() - start) * 1000)
+
+            if (i + 1) % 256 == 0:
+                os.write(master_fd, b'\n')
+                _read_until(master_fd, lambda data: data.endswith(b'\n'), deadline)
+                os.read(slave_fd, 4096)
+    finally:
+        os.close(slave_fd)
+        os.close(master_fd)
+
+    return {
+        'avg': statistics.mean(times),
+        'min': min(times),
+        'max': max(times),
+        'p95': statistics.quantiles(times, n=20)[18],
+        'unit': 'ms',
+        'target': 5,
+        'description': 'Keystroke echo latency (cooked PTY)'
+    }
+
+
+def run_terminal_workloads():
+    """Run every PTY workload, each with its CPU time and peak RSS."""
+    return {
+        'echo_latency': with_resource_usage(measure_echo_latency),
+        'output_throughput': with_resource_usage(measure_pty_throughput),
+        'interleaved_throughput': with_resource_usage(measure_interleaved_throughput),
+    }
+
+
+def terminal_metrics(results):
+    """Flatten run_terminal_workloads() results into baseline metrics."""
+    metrics = {}
+
+    if 'echo_latency' in results:
+        for stat in ['avg', 'p95']:
+            metrics[f'echo_latency.{stat}'] = {
+                'value': results['echo_latency'][stat], 'higher_is_better': False
+            }
+
+    for key in ['output_throughput', 'interleaved_throughput']:
+        if key in results:
+            metrics[f'{key}.mb_per_sec'] = {
+                'value': results[key]['mb_per_sec'], 'higher_is_better': True
+            }
+
+    for key in ['echo_latency', 'output_throughput', 'interleaved_throughput']:
+        if key in results and 'cpu_time' in results[key]:
+            metrics[f'{key}.cpu_time'] = {
+                'value': results[key]['cpu_time'], 'higher_is_better': False
+            }
+
+    rss = [result['max_rss_mb'] for result in results.values() if 'max_rss_mb' in result]
+    if rss:
+        metrics['max_rss_mb'] = {'value': max(rss), 'higher_is_better': False}
+
+    return metrics
+
+
+def save_baseline(path, metrics):
+    """Save {metric: {'value': ..., 'higher_is_better': ...}} as a JSON baseline."""
+    baseline = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'metrics': metrics,
+    }
+    Path(path).write_text(json.dumps(baseline, indent=2) + '\n')
+
+
+def load_baseline(path):
+    """Load the metrics dict from a JSON baseline."""
+    return json.loads(Path(path).read_text())['metrics']
+
+
+def find_regressions(baseline, current, tolerance, floors=None):
+    """
+    Compare current metrics against baseline metrics.
+
+    A metric regresses when it moves in the bad direction by more than
+    max(abs(baseline) * tolerance, floor), where floor is the metric's
+    absolute slack from `floors` (default: METRIC_FLOORS).
+
+    Returns:
+        List of (metric, baseline_value, current_value) tuples that regressed.
+    """
+    floors = METRIC_FLOORS if floors is None else floors
+    regressions = []
+
+    for name, entry in baseline.items():
+        if name not in current:
+            continue
+
+        old = entry['value']
+        new = current[name]['value']
+        allowed = max(abs(old) * tolerance, floors.get(name, DEFAULT_FLOOR))
+
+        if entry['higher_is_better']:
+            regressed = new < old - allowed
+        else:
+            regressed = new > old + allowed
+
+        if regressed:
+            regressions.append((name, old, new))
+
+    return regressions
+
+
+def print_comparison(baseline, current, regressions, tolerance):
+    """Print a baseline comparison table."""
+    regressed = {name for name, _, _ in regressions}
+
+    print("\n[BASELINE COMPARISON]")
+    print("-"*80)
+
+    for name, entry in baseline.items():
+        if name not in current:
+            continue
+        status = "✗ REGRESSED" if name in regressed else "✓ OK"
+        print(f"  {name:<32} {entry['value']:>12.3f} -> {current[name]['value']:>12.3f} {status}")
+
+    print(f"\nTolerance: {tolerance * 100:.0f}%")
+
+
+def main():
+    """Run the standalone PTY workloads."""
+    parser = argparse.ArgumentParser(description="Split view terminal-layer benchmark")
+    parser.add_argument('--save-baseline', metavar='PATH',
+                        help='Save results as a JSON baseline')
+    parser.add_argument('--baseline', metavar='PATH',
+                        help='Compare results against a JSON baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed regression as a fraction (default: 0.2)')
+    args = parser.parse_args()
+
+    print("Running PTY workloads...")
+    results = run_terminal_workloads()
+
+    for key, result in results.items():
+        print(f"\n{result['description']}:")
+        if 'avg' in result:
+            print(f"  Average:     {result['avg']:>10.3f} {result['unit']}")
+            print(f"  P95:         {result['p95']:>10.3f} {result['unit']}")
+        else:
+            print(f"  Throughput:  {result['mb_per_sec']:>10.1f} {result['unit']}")
+        print(f"  CPU time:    {result['cpu_time']:>10.3f} s")
+        print(f"  Peak RSS:    {result['max_rss_mb']:>10.1f} MB")
+
+    metrics = terminal_metrics(results)
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, metrics)
+        print(f"\nBaseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        baseline = load_baseline(args.baseline)
+        regressions = find_regressions(baseline, metrics, args.tolerance)
+        print_comparison(baseline, metrics, regressions, args.tolerance)
+        if regressions:
+            print(f"Status: ✗ {len(regressions)} metric(s) regressed")
+            sys.exit(1)
+        print("Status: ✓ NO REGRESSIONS")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,8 @@ import {
   writeFileSync,
   rmSync,
   existsSync,
+  statSync,
+  utimesSync,
 } from "node:fs";
 import { join } from "node:path";
 import { tmpdir } from "node:os";
@@ -745,6 +747,48 @@ overrides:
     expect(result2.agents["oracle"]?.temperature).toBe(0.5);
   });
 
+  it("should invalidate cache when a config file changes on disk", async () => {
+    const yoyoDevDir = createYoyoDevDir(testDir);
+    const agentsDir = createAgentsDir(yoyoDevDir);
+    const agentFile = join(agentsDir, "oracle.yml");
+
+    writeYamlFile(
+      agentFile,
+      `
+name: oracle
+overrides:
+  temperature: 0.2
+`
+    );
+
+    const result1 = await loadAgentConfigs({
+      projectRoot: testDir,
+      userHome: userHome,
+      enableCache: true,
+    });
+
+    // Modify file without clearing the cache
+    writeYamlFile(
+      agentFile,
+      `
+name: oracle
+overrides:
+  temperature: 0.5
+`
+    );
+    const later = new Date(Date.now() + 5000);
+    utimesSync(agentFile, later, later);
+
+    const result2 = await loadAgentConfigs({
+      projectRoot: testDir,
+      userHome: userHome,
+      enableCache: true,
+    });
+
+    expect(result1).not.toBe(result2);
+    expect(result2.agents["oracle"]?.temperature).toBe(0.5);
+  });
+
   it("should not cache when enableCache is false", async () => {
     const result1 = await loadAgentConfigs({
       projectRoot: testDir,
@@ -761,4 +805,46 @@ overrides:
     // Results should be different objects
     expect(result1).not.toBe(result2);
   });
+
+  it("should always re-read files when enableCache is false", async () => {
+    const yoyoDevDir = createYoyoDevDir(testDir);
+    const agentsDir = createAgentsDir(yoyoDevDir);
+    const agentFile = join(agentsDir, "oracle.yml");
+
+    writeYamlFile(
+      agentFile,
+      `
+name: oracle
+overrides:
+  temperature: 0.2
+`
+    );
+    const { atime, mtime } = statSync(agentFile);
+
+    const result1 = await loadAgentConfigs({
+      projectRoot: testDir,
+      userHome: userHome,
+      enableCache: false,
+    });
+
+    // Same size and mtime, so only a fresh read sees the new value
+    writeYamlFile(
+      agentFile,
+      `
+name: oracle
+overrides:
+  temperature: 0.5
+`
+    );
+    utimesSync(agentFile, atime, mtime);
+
+    const result2 = await loadAgentConfigs({
+      projectRoot: testDir,
+      userHome: userHome,
+      enableCache: false,
+    });
+
+    expect(result1.agents["oracle"]?.temperature).toBe(0.2);
+    expect(result2.agents["oracle"]?.temperature).toBe(0.5);
+  });
 });
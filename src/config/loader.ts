@@ -45,12 +45,99 @@ const USER_AGENTS_FILE = ".yoyo-dev/config/agents.yml";
 let configCache: ConfigCacheEntry | null = null;
 let cacheKey: string | null = null;
 
+/**
+ * Parsed YAML files keyed by path, reused while mtime and size are unchanged
+ */
+const yamlCache = new Map<
+  string,
+  { mtimeMs: number; size: number; parsed: unknown }
+>();
+
 /**
  * Clear the configuration cache
  */
 export function clearConfigCache(): void {
   configCache = null;
   cacheKey = null;
+  yamlCache.clear();
+}
+
+/**
+ * Read and parse a YAML file
+ *
+ * With useCache, reuses the previous parse while the file is unchanged on
+ * disk. Callers always get their own copy, so the cached parse can't be
+ * mutated through a returned config.
+ */
+function readYamlFile<T>(filePath: string, useCache: boolean): T {
+  if (!useCache) {
+    return yaml.load(readFileSync(filePath, "utf-8")) as T;
+  }
+
+  const stat = statSync(filePath);
+  const cached = yamlCache.get(filePath);
+  if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) {
+    return structuredClone(cached.parsed) as T;
+  }
+
+  const parsed = yaml.load(readFileSync(filePath, "utf-8"));
+  yamlCache.set(filePath, { mtimeMs: stat.mtimeMs, size: stat.size, parsed });
+  return structuredClone(parsed) as T;
+}
+
+/**
+ * Get modification times for the given paths (-1 for missing files)
+ */
+function getFileMtimes(paths: string[]): Record<string, number> {
+  const mtimes: Record<string, number> = {};
+  for (const path of paths) {
+    mtimes[path] = existsSync(path) ? statSync(path).mtimeMs : -1;
+  }
+  return mtimes;
+}
+
+/**
+ * Get the config files a load will read, plus the local agents directory
+ * so added or removed overrides are noticed
+ */
+function getConfigFilePaths(
+  projectRoot: string,
+  userHome: string,
+  skipSources: ConfigSource[]
+): string[] {
+  const paths: string[] = [];
+
+  if (!skipSources.includes("user")) {
+    paths.push(join(userHome, USER_AGENTS_FILE));
+  }
+  if (!skipSources.includes("project")) {
+    paths.push(join(projectRoot, PROJECT_CONFIG_FILE));
+  }
+  if (!skipSources.includes("local")) {
+    const agentsDir = join(projectRoot, LOCAL_AGENTS_DIR);
+    paths.push(agentsDir);
+
+    if (existsSync(agentsDir)) {
+      for (const entry of readdirSync(agentsDir)) {
+        const ext = extname(entry).toLowerCase();
+        if (ext === ".yml" || ext === ".yaml") {
+          paths.push(join(agentsDir, entry));
+        }
+      }
+    }
+  }
+
+  return paths;
+}
+
+/**
+ * Check whether any file recorded in a cache entry changed on disk
+ */
+function hasStaleFiles(entry: ConfigCacheEntry): boolean {
+  const current = getFileMtimes(Object.keys(entry.fileMtimes));
+  return Object.entries(entry.fileMtimes).some(
+    ([path, mtime]) => current[path] !== mtime
+  );
 }
 
 /**
@@ -92,10 +179,21 @@ export async function loadAgentConfigs(
 
   // Check cache
   const key = getCacheKey(options);
-  if (enableCache && configCache && cacheKey === key) {
+  if (
+    enableCache &&
+    configCache &&
+    cacheKey === key &&
+    !hasStaleFiles(configCache)
+  ) {
     return configCache.result;
   }
 
+  // Snapshot mtimes before reading, so a file that changes mid-load is
+  // stale on the next call instead of cached with its old content
+  const fileMtimes = enableCache
+    ? getFileMtimes(getConfigFilePaths(projectRoot, userHome, skipSources))
+    : {};
+
   const errors: ConfigError[] = [];
   const warnings: ConfigWarning[] = [];
   const loadedFiles: ConfigFileInfo[] = [];
@@ -110,7 +208,7 @@ export async function loadAgentConfigs(
 
   // Load user-level config (lowest priority of overrides)
   if (!skipSources.includes("user")) {
-    const userResult = await loadUserConfig(userHome);
+    const userResult = await loadUserConfig(userHome, enableCache);
     loadedFiles.push(...userResult.files);
     errors.push(...userResult.errors);
 
@@ -121,7 +219,7 @@ export async function loadAgentConfigs(
 
   // Load project config (medium priority)
   if (!skipSources.includes("project")) {
-    const projectResult = await loadProjectConfig(projectRoot);
+    const projectResult = await loadProjectConfig(projectRoot, enableCache);
     loadedFiles.push(...projectResult.files);
     errors.push(...projectResult.errors);
 
@@ -132,7 +230,11 @@ export async function loadAgentConfigs(
 
   // Load local agent overrides (highest priority)
   if (!skipSources.includes("local")) {
-    const localResult = await loadLocalAgents(projectRoot, builtinAgents);
+    const localResult = await loadLocalAgents(
+      projectRoot,
+      builtinAgents,
+      enableCache
+    );
     loadedFiles.push(...localResult.files);
     errors.push(...localResult.errors);
 
@@ -153,7 +255,7 @@ export async function loadAgentConfigs(
     configCache = {
       result,
       timestamp: Date.now(),
-      fileMtimes: {},
+      fileMtimes,
     };
     cacheKey = key;
   }
@@ -171,7 +273,7 @@ export async function discoverLocalAgents(
   projectRoot: string
 ): Promise<DiscoveredAgent[]> {
   const builtinAgents = await getBuiltinAgents();
-  const result = await loadLocalAgents(projectRoot, builtinAgents);
+  const result = await loadLocalAgents(projectRoot, builtinAgents, false);
   return result.agents;
 }
 
@@ -372,7 +474,10 @@ function isMergedConfig(
 /**
  * Load user-level config
  */
-async function loadUserConfig(userHome: string): Promise<{
+async function loadUserConfig(
+  userHome: string,
+  useCache: boolean
+): Promise<{
   config: UserAgentsConfigFile | null;
   files: ConfigFileInfo[];
   errors: ConfigError[];
@@ -393,8 +498,7 @@ async function loadUserConfig(userHome: string): Promise<{
   }
 
   try {
-    const content = readFileSync(filePath, "utf-8");
-    const parsed = yaml.load(content) as UserAgentsConfigFile;
+    const parsed = readYamlFile<UserAgentsConfigFile>(filePath, useCache);
 
     // Validate
     const validation = validateConfigFile(parsed, "user", filePath);
@@ -417,7 +521,10 @@ async function loadUserConfig(userHome: string): Promise<{
 /**
  * Load project config
  */
-async function loadProjectConfig(projectRoot: string): Promise<{
+async function loadProjectConfig(
+  projectRoot: string,
+  useCache: boolean
+): Promise<{
   config: ProjectAgentsConfig | null;
   files: ConfigFileInfo[];
   errors: ConfigError[];
@@ -438,8 +545,7 @@ async function loadProjectConfig(projectRoot: string): Promise<{
   }
 
   try {
-    const content = readFileSync(filePath, "utf-8");
-    const parsed = yaml.load(content) as Record<string, unknown>;
+    const parsed = readYamlFile<Record<string, unknown>>(filePath, useCache);
 
     // Extract agents section
     const agentsConfig: ProjectAgentsConfig = {
@@ -470,7 +576,8 @@ async function loadProjectConfig(projectRoot: string): Promise<{
  */
 async function loadLocalAgents(
   projectRoot: string,
-  builtinAgents: Record<string, AgentConfig>
+  builtinAgents: Record<string, AgentConfig>,
+  useCache: boolean
 ): Promise<{
   agents: DiscoveredAgent[];
   files: ConfigFileInfo[];
@@ -509,8 +616,7 @@ async function loadLocalAgents(
     files.push(fileInfo);
 
     try {
-      const content = readFileSync(filePath, "utf-8");
-      const parsed = yaml.load(content) as AgentConfigFile;
+      const parsed = readYamlFile<AgentConfigFile>(filePath, useCache);
 
       // Validate
       const validation = validateConfigFile(parsed, "agent", filePath);
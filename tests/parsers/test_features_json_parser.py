@@ -453,6 +453,101 @@ class TestFeaturesJsonFilePersistence:
         assert reloaded["features"][0]["sub_features"][0]["implemented"] is True
         assert len(reloaded["features"][0]["test_steps"]) == 1
 
+    def test_batch_update_with_id_index_and_atomic_write(self, tmp_path):
+        """Test applying a batch of updates through an id index in one write."""
+        # Arrange
+        spec_path = tmp_path / "specs" / "batch-update"
+        spec_path.mkdir(parents=True)
+        features_file = spec_path / "features.json"
+
+        # Progress counts sub-features, plus features that have none
+        # (1.1, 2.1, 2.2, 3, 4 -> 5 tracked)
+        features_data = {
+            "spec_name": "Batch Test",
+            "created": "2025-12-05",
+            "features": [
+                {
+                    "id": "1", "name": "F1", "description": "", "implemented": True, "tested": True, "test_steps": [],
+                    "sub_features": [
+                        {"id": "1.1", "name": "Sub 1.1", "implemented": True, "tested": True},
+                    ]
+                },
+                {
+                    "id": "2", "name": "F2", "description": "", "implemented": False, "tested": False, "test_steps": [],
+                    "sub_features": [
+                        {"id": "2.1", "name": "Sub 2.1", "implemented": True, "tested": False},
+                        {"id": "2.2", "name": "Sub 2.2", "implemented": False, "tested": False},
+                    ]
+                },
+                {"id": "3", "name": "F3", "description": "", "implemented": False, "tested": False, "test_steps": [], "sub_features": []},
+                {"id": "4", "name": "F4", "description": "", "implemented": False, "tested": False, "test_steps": [], "sub_features": []},
+            ],
+            "progress_summary": {
+                "total_features": 5,
+                "implemented": 2,
+                "tested": 1,
+                "completion_percentage": 20,
+                "next_incomplete": "2.1"
+            }
+        }
+        features_file.write_text(json.dumps(features_data, indent=2))
+
+        # Act - load once, index tracked nodes by id in feature order,
+        # adjust counters only for changed nodes
+        loaded = json.loads(features_file.read_text())
+        index = {}
+        parents = {}
+        order = []
+        for feature in loaded["features"]:
+            for node in feature["sub_features"] or [feature]:
+                index[node["id"]] = node
+                parents[node["id"]] = feature
+                order.append(node["id"])
+        position = {node_id: i for i, node_id in enumerate(order)}
+        summary = loaded["progress_summary"]
+
+        for feature_id in ["1.1", "2.1", "2.2", "3"]:  # "1.1" is already tested
+            node = index[feature_id]
+            if not node["implemented"]:
+                node["implemented"] = True
+                summary["implemented"] += 1
+            if not node["tested"]:
+                node["tested"] = True
+                summary["tested"] += 1
+
+            # A parent with sub-features is done once all of them are
+            parent = parents[feature_id]
+            if parent is not node:
+                parent["implemented"] = all(sub["implemented"] for sub in parent["sub_features"])
+                parent["tested"] = all(sub["tested"] for sub in parent["sub_features"])
+
+        summary["completion_percentage"] = int(summary["tested"] / summary["total_features"] * 100)
+
+        # Nodes only ever become tested, so the cursor only moves forward
+        cursor = position[summary["next_incomplete"]]
+        while cursor < len(order) and index[order[cursor]]["tested"]:
+            cursor += 1
+        summary["next_incomplete"] = order[cursor] if cursor < len(order) else None
+
+        tmp_file = spec_path / "features.json.tmp"
+        tmp_file.write_text(json.dumps(loaded, indent=2))
+        tmp_file.replace(features_file)
+
+        # Assert - counters match a full recount and no temp file is left
+        saved = json.loads(features_file.read_text())
+        tracked = [
+            node
+            for feature in saved["features"]
+            for node in feature["sub_features"] or [feature]
+        ]
+        assert len(tracked) == saved["progress_summary"]["total_features"] == 5
+        assert saved["progress_summary"]["implemented"] == sum(n["implemented"] for n in tracked) == 4
+        assert saved["progress_summary"]["tested"] == sum(n["tested"] for n in tracked) == 4
+        assert saved["progress_summary"]["completion_percentage"] == 80
+        assert saved["progress_summary"]["next_incomplete"] == "4"
+        assert saved["features"][1]["tested"] is True, "Parent follows its sub-features"
+        assert not tmp_file.exists()
+
 
 class TestFeaturesJsonConversionFromTasksMd:
     """Test suite for converting tasks.md to features.json format."""
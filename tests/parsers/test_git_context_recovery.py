@@ -412,6 +412,69 @@ Automatically resuming from task {next_task}..."""
         assert "Next task: 1.3" in resume_message
 
 
+class TestRecoveryCheckpoint:
+    """Test suite for incremental recovery from a features.json checkpoint."""
+
+    @staticmethod
+    def apply_commits(state, commits):
+        """Apply commits (most recent first) on top of an existing status map."""
+        state = dict(state)
+        seen = set()
+        for commit in commits:
+            task_match = re.search(r"task-(\d+\.\d+)", commit["message"])
+            if not task_match or task_match.group(1) in seen:
+                continue
+            task_id = task_match.group(1)
+            seen.add(task_id)
+            if "[TESTED]" in commit["message"]:
+                state[task_id] = "tested"
+            elif "[PARTIAL]" in commit["message"]:
+                state[task_id] = "partial"
+            elif "[FEATURE]" in commit["message"]:
+                state[task_id] = "implemented"
+        return state
+
+    def test_only_commits_after_checkpoint_are_processed(self):
+        """Test that recovery resumes from the checkpointed state."""
+        # Arrange - full history, most recent first
+        history = [
+            {"hash": "e5", "message": "[TESTED] task-1.3: Dashboard verified"},
+            {"hash": "d4", "message": "[FEATURE] task-1.3: Dashboard added"},
+            {"hash": "c3", "message": "[TESTED] task-1.2: Registration complete"},
+            {"hash": "b2", "message": "[TESTED] task-1.1: Login complete"},
+            {"hash": "a1", "message": "[FEATURE] task-1.1: Login handler"},
+        ]
+        checkpoint = {"commit": "c3", "state": {"1.1": "tested", "1.2": "tested"}}
+
+        # Act - equivalent of `git log <checkpoint>..HEAD`
+        hashes = [c["hash"] for c in history]
+        new_commits = history[:hashes.index(checkpoint["commit"])]
+        state = self.apply_commits(checkpoint["state"], new_commits)
+
+        # Assert - same result as a full walk, from two commits
+        assert len(new_commits) == 2
+        assert state == self.apply_commits({}, history)
+
+    def test_full_walk_when_checkpoint_not_in_history(self):
+        """Test fallback to a full walk when history was rewritten."""
+        # Arrange
+        history = [
+            {"hash": "x9", "message": "[PARTIAL] task-1.2: Registration WIP"},
+            {"hash": "b2", "message": "[TESTED] task-1.1: Login complete"},
+        ]
+        checkpoint = {"commit": "c3", "state": {"1.1": "tested", "1.2": "tested"}}
+
+        # Act
+        hashes = [c["hash"] for c in history]
+        if checkpoint["commit"] in hashes:
+            state = self.apply_commits(checkpoint["state"], history[:hashes.index(checkpoint["commit"])])
+        else:
+            state = self.apply_commits({}, history)
+
+        # Assert - stale checkpoint state is discarded
+        assert state == {"1.1": "tested", "1.2": "partial"}
+
+
 class TestCommitMessageGeneration:
     """Test suite for generating commit messages with proper prefixes."""
 
@@ -493,3 +556,30 @@ class TestGitLogLimits:
         # Assert
         assert len(relevant_commits) == 3
         assert all("task-" in c["message"] for c in relevant_commits)
+
+    def test_single_pass_classifier_over_log_stream(self):
+        """Test classifying a `git log --format='%h %ct %s'` stream with one pattern."""
+        # Arrange
+        log_output = "\n".join([
+            "abc1234 1733400000 [TESTED] task-1.1: Login complete",
+            "bcd2345 1733390000 chore: Update deps",
+            "cde3456 1733380000 [PARTIAL] task-1.2: Registration WIP",
+            "def4567 1733370000 [FEATURE] auth: No task id",
+            "efa5678 1733360000 [FEATURE] task-1.3: Dashboard added",
+        ])
+        classifier = re.compile(
+            r"^(?P<sha>\S+) (?P<timestamp>\d+) "
+            r"\[(?P<status>FEATURE|TESTED|PARTIAL)\] task-(?P<task_id>\d+\.\d+)",
+            re.MULTILINE,
+        )
+
+        # Act
+        records = [match.group("sha", "timestamp", "status", "task_id")
+                   for match in classifier.finditer(log_output)]
+
+        # Assert - irrelevant commits never produce a record
+        assert records == [
+            ("abc1234", "1733400000", "TESTED", "1.1"),
+            ("cde3456", "1733380000", "PARTIAL", "1.2"),
+            ("efa5678", "1733360000", "FEATURE", "1.3"),
+        ]
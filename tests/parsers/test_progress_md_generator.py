@@ -449,6 +449,109 @@ class TestProgressMdAutoGeneration:
         assert should_regenerate is True
         assert parent_features["2"]["all_tested"] is False
 
+    def test_regenerate_only_affected_sections(self):
+        """Test that a feature change re-renders only the sections it touches."""
+        # Arrange
+        progress_md = """# Progress Report
+
+> Spec: Test Feature
+> Last Updated: 2025-12-05 14:30
+
+## Summary
+
+**Completion:** 40% (2/5 features tested)
+
+## Completed Features
+
+- [x] Feature 1.1 - Login (abc1234)
+- [x] Feature 1.2 - Register (def5678)
+
+## In Progress
+
+- [ ] Feature 1.3 (implemented, tests pending)
+
+## Remaining Features
+
+- [ ] Feature 2.1 - Dashboard
+- [ ] Feature 2.2 - Settings
+
+## Git Log Summary
+
+Recent task-related commits:
+- def5678 [TESTED] task-1.2: Register
+- abc1234 [TESTED] task-1.1: Login
+
+## Resume Instructions
+
+Next task: **1.3** (currently in progress)
+"""
+        section_names = {
+            "remaining": "Remaining Features",
+            "implemented": "In Progress",
+            "tested": "Completed Features",
+        }
+
+        def status(implemented, tested):
+            return "tested" if tested else "implemented" if implemented else "remaining"
+
+        # Act - split on "## " headings, keeping each heading with its body
+        header, *chunks = re.split(r"(?m)^(?=## )", progress_md)
+        sections = {chunk.split("\n", 1)[0][3:]: chunk for chunk in chunks}
+        original = dict(sections)
+        assert header + "".join(original.values()) == progress_md
+
+        # Feature 2.1 implemented and tested in one batch: remaining -> tested
+        old = status(implemented=False, tested=False)
+        new = status(implemented=True, tested=True)
+        affected = {"Summary", section_names[old], section_names[new]}
+
+        sections["Summary"] = "## Summary\n\n**Completion:** 60% (3/5 features tested)\n\n"
+        sections["Completed Features"] = (
+            original["Completed Features"].rstrip("\n")
+            + "\n- [x] Feature 2.1 - Dashboard (aaa1111)\n\n"
+        )
+        sections["Remaining Features"] = (
+            "## Remaining Features\n\n- [ ] Feature 2.2 - Settings\n\n"
+        )
+
+        regenerated = header + "".join(sections.values())
+
+        # Assert - unaffected sections are byte-identical in the output
+        assert affected == {"Summary", "Remaining Features", "Completed Features"}
+        _, *new_chunks = re.split(r"(?m)^(?=## )", regenerated)
+        output = {chunk.split("\n", 1)[0][3:]: chunk for chunk in new_chunks}
+
+        assert list(output) == list(original), "Section order is preserved"
+        for name in set(original) - affected:
+            assert output[name] == original[name]
+            assert original[name] in regenerated
+        for name in affected:
+            assert output[name] != original[name]
+        assert "Feature 2.1 - Dashboard (aaa1111)" in output["Completed Features"]
+        assert "Feature 2.1" not in output["Remaining Features"]
+
+    def test_skip_write_when_content_unchanged(self, tmp_path):
+        """Test that progress.md is not rewritten when nothing changed."""
+        # Arrange
+        progress_file = tmp_path / "progress.md"
+        body = "## Summary\n\n**Completion:** 40% (2/5 features tested)\n"
+        progress_file.write_text("# Progress Report\n\n> Last Updated: 2025-12-05 10:00:00\n\n" + body)
+        mtime_before = progress_file.stat().st_mtime_ns
+
+        # Act - re-joined sections keep the old header, so drop the
+        # timestamp line from both sides before comparing
+        def without_timestamp(text):
+            return re.sub(r"^> Last Updated: .*\n", "", text, flags=re.M)
+
+        existing = progress_file.read_text()
+        regenerated = "# Progress Report\n\n> Last Updated: 2025-12-05 10:00:00\n\n" + body
+        if without_timestamp(regenerated) != without_timestamp(existing):
+            progress_file.write_text(regenerated.replace("2025-12-05 10:00:00", "2025-12-06 09:00:00"))
+
+        # Assert
+        assert progress_file.stat().st_mtime_ns == mtime_before
+        assert "2025-12-05 10:00:00" in progress_file.read_text()
+
     def test_timestamp_updated_on_regeneration(self):
         """Test that timestamp is updated when progress.md is regenerated."""
         # Arrange
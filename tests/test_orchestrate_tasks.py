@@ -273,6 +273,106 @@ class TestOrchestrateTasksCommand:
                 assert task_id not in all_tasks, "Task should only appear once"
                 all_tasks.add(task_id)
 
+    def test_dependency_graph_dispatches_ready_tasks_immediately(self):
+        """Test that a task starts as soon as its own dependencies finish."""
+        depends_on = {1: [], 2: [1], 3: [], 4: [3]}
+        durations = {1: 10, 2: 1, 3: 1, 4: 1}
+        max_concurrency = 2
+
+        # Simulate the Step 5 ready-queue dispatch loop
+        ready = [task for task, deps in depends_on.items() if not deps]
+        running = {}
+        completed = {}
+        started = {}
+        now = 0
+
+        while len(completed) < len(depends_on):
+            while ready and len(running) < max_concurrency:
+                task = ready.pop(0)
+                started[task] = now
+                running[task] = now + durations[task]
+
+            task = min(running, key=running.get)
+            now = running.pop(task)
+            completed[task] = now
+
+            for candidate, deps in depends_on.items():
+                if candidate in ready or candidate in running or candidate in completed:
+                    continue
+                if all(dep in completed for dep in deps):
+                    ready.append(candidate)
+
+        # Task 4 does not wait for the slow task 1 (as [[1, 3], [2, 4]] would)
+        assert started[4] == completed[3] == 1
+        assert started[2] == completed[1] == 10
+        assert max(completed.values()) == 11
+
+    def test_dependency_graph_cycle_detection(self):
+        """Test that circular dependencies between task groups are rejected."""
+        depends_on = {1: [3], 2: [1], 3: [2], 4: []}
+
+        remaining = dict(depends_on)
+        while True:
+            removable = [task for task, deps in remaining.items()
+                         if not any(dep in remaining for dep in deps)]
+            if not removable:
+                break
+            for task in removable:
+                del remaining[task]
+
+        assert sorted(remaining) == [1, 2, 3], "Tasks in the cycle should remain"
+
+    def test_dependency_graph_rejects_unselected_dependencies(self):
+        """Test that a dependency on an unselected incomplete group is reported, not treated as a cycle."""
+        depends_on = {2: [1], 3: [2]}
+        selected = {2, 3}
+        complete_in_tasks_md = set()
+
+        unselected = {
+            (task, dep)
+            for task, deps in depends_on.items()
+            for dep in deps
+            if dep not in selected and dep not in complete_in_tasks_md
+        }
+
+        assert unselected == {(2, 1)}
+
+        # Once task group 1 is complete it is ignored and the graph is valid
+        complete_in_tasks_md.add(1)
+        depends_on = {task: [dep for dep in deps if dep not in complete_in_tasks_md]
+                      for task, deps in depends_on.items()}
+        assert all(dep in selected for deps in depends_on.values() for dep in deps)
+
+    def test_failed_task_blocks_dependents(self):
+        """Test that a failed task blocks its dependents and the loop still terminates."""
+        depends_on = {1: [], 2: [1], 3: [2], 4: []}
+        fails = {1}
+
+        ready = [task for task, deps in depends_on.items() if not deps]
+        completed, failed, blocked = [], [], []
+
+        def dependents(task):
+            direct = [t for t, deps in depends_on.items() if task in deps]
+            return direct + [d for t in direct for d in dependents(t)]
+
+        while len(completed) + len(failed) + len(blocked) < len(depends_on):
+            task = ready.pop(0)
+            if task in fails:
+                failed.append(task)
+                blocked.extend(t for t in dependents(task) if t not in blocked)
+            else:
+                completed.append(task)
+
+            for candidate, deps in depends_on.items():
+                if candidate in ready + completed + failed + blocked:
+                    continue
+                if all(dep in completed for dep in deps):
+                    ready.append(candidate)
+
+        assert failed == [1]
+        assert sorted(blocked) == [2, 3]
+        assert completed == [4], "Independent tasks still run"
+
     # ========================================================================
     # Orchestration Report Tests
     # ========================================================================
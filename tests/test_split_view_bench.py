@@ -0,0 +1,151 @@
+"""
+Tests for split view benchmark helpers
+
+Tests the standalone PTY workloads and the JSON baseline regression
+check in scripts/split_view_bench.py.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import split_view_bench
+from split_view_bench import (
+    find_regressions,
+    load_baseline,
+    measure_echo_latency,
+    measure_interleaved_throughput,
+    measure_pty_throughput,
+    save_baseline,
+    terminal_metrics,
+    with_resource_usage,
+)
+
+
+class TestPtyWorkloads:
+    """Test the PTY workloads."""
+
+    def test_all_bytes_received(self):
+        """Test that every written byte is read back from the PTY."""
+        result = measure_pty_throughput(total_bytes=1024 * 1024)
+
+        assert result['bytes'] == 1024 * 1024
+        assert result['mb_per_sec'] > 0
+
+    def test_interleaved_receives_both_streams(self):
+        """Test that both PTYs deliver every byte when writes interleave."""
+        result = measure_interleaved_throughput(total_bytes=512 * 1024)
+
+        assert result['bytes'] == 2 * 512 * 1024
+
+    def test_echo_latency_samples(self):
+        """Test that every keystroke echo is timed, across a line flush."""
+        result = measure_echo_latency(samples=300)
+
+        assert 0 < result['min'] <= result['avg'] <= result['max']
+
+    def test_expired_deadline_raises(self):
+        """Test that throughput raises instead of blocking past its timeout."""
+        with pytest.raises(RuntimeError, match="Timed out"):
+            measure_pty_throughput(total_bytes=1024 * 1024, timeout=0)
+
+    def test_reader_stopping_early_raises(self, monkeypatch):
+        """Test that a reader hitting EOF raises instead of hanging the writer."""
+        monkeypatch.setattr(split_view_bench.os, "read", lambda fd, n: b"")
+
+        with pytest.raises(RuntimeError, match="received 0 of"):
+            measure_pty_throughput(total_bytes=1024 * 1024, timeout=5)
+
+    def test_resource_usage_becomes_metrics(self):
+        """Test that CPU time and peak RSS are recorded as baseline metrics."""
+        results = {
+            'output_throughput': with_resource_usage(measure_pty_throughput, total_bytes=1024 * 1024),
+        }
+
+        assert results['output_throughput']['cpu_time'] >= 0
+        assert results['output_throughput']['max_rss_mb'] > 0
+
+        metrics = terminal_metrics(results)
+
+        assert metrics['output_throughput.cpu_time']['higher_is_better'] is False
+        assert metrics['max_rss_mb']['value'] == results['output_throughput']['max_rss_mb']
+        assert metrics['output_throughput.mb_per_sec']['higher_is_better'] is True
+
+    def test_script_runs_standalone(self, tmp_path):
+        """Test that the script runs and round-trips its own baseline."""
+        baseline = tmp_path / "bench.json"
+        script = SCRIPTS_DIR / "split_view_bench.py"
+
+        saved = subprocess.run(
+            [sys.executable, str(script), "--save-baseline", str(baseline)],
+            capture_output=True, text=True, timeout=60,
+        )
+        assert saved.returncode == 0, saved.stderr
+        assert baseline.exists()
+
+        # Generous tolerance so machine noise can't fail the comparison
+        compared = subprocess.run(
+            [sys.executable, str(script), "--baseline", str(baseline), "--tolerance", "0.95"],
+            capture_output=True, text=True, timeout=60,
+        )
+        assert compared.returncode == 0, compared.stdout + compared.stderr
+
+
+class TestBaselineComparison:
+    """Test baseline save/load and regression detection."""
+
+    def test_save_and_load_baseline(self, tmp_path):
+        """Test that metrics survive a save/load round trip."""
+        metrics = {'output_throughput.mb_per_sec': {'value': 120.0, 'higher_is_better': True}}
+        path = tmp_path / "baseline.json"
+
+        save_baseline(path, metrics)
+
+        assert load_baseline(path) == metrics
+
+    def test_relative_regression_detected(self):
+        """Test that a drop beyond the tolerance is a regression."""
+        baseline = {'output_throughput.mb_per_sec': {'value': 100.0, 'higher_is_better': True}}
+        current = {'output_throughput.mb_per_sec': {'value': 50.0, 'higher_is_better': True}}
+
+        regressions = find_regressions(baseline, current, tolerance=0.2)
+
+        assert regressions == [('output_throughput.mb_per_sec', 100.0, 50.0)]
+
+    def test_change_within_tolerance_passes(self):
+        """Test that a change inside the tolerance is not a regression."""
+        baseline = {'input_latency.avg': {'value': 10.0, 'higher_is_better': False}}
+        current = {'input_latency.avg': {'value': 11.5, 'higher_is_better': False}}
+
+        assert find_regressions(baseline, current, tolerance=0.2) == []
+
+    def test_zero_baseline_uses_absolute_floor(self):
+        """Test that noise on a zero baseline is not a regression."""
+        baseline = {'input_latency.avg': {'value': 0.0, 'higher_is_better': False}}
+        current = {'input_latency.avg': {'value': 0.01, 'higher_is_better': False}}
+
+        assert find_regressions(baseline, current, tolerance=0.2) == []
+
+    def test_negative_baseline_uses_absolute_floor(self):
+        """Test that a negative memory increase baseline tolerates noise."""
+        baseline = {'memory_usage.increase': {'value': -0.5, 'higher_is_better': False}}
+        noisy = {'memory_usage.increase': {'value': 0.3, 'higher_is_better': False}}
+        grown = {'memory_usage.increase': {'value': 20.0, 'higher_is_better': False}}
+
+        assert find_regressions(baseline, noisy, tolerance=0.2) == []
+        assert find_regressions(baseline, grown, tolerance=0.2) == [
+            ('memory_usage.increase', -0.5, 20.0)
+        ]
+
+    @pytest.mark.parametrize("floors", [{}, {'input_latency.avg': 0.0}])
+    def test_custom_floors(self, floors):
+        """Test that callers can override the per-metric floors."""
+        baseline = {'input_latency.avg': {'value': 0.0, 'higher_is_better': False}}
+        current = {'input_latency.avg': {'value': 0.01, 'higher_is_better': False}}
+
+        assert len(find_regressions(baseline, current, tolerance=0.2, floors=floors)) == 1